@@ -0,0 +1,90 @@
+"""
+STARTUP BENCHMARK
+
+Measures how fast the bot comes back after a restart so regressions are easy to spot.
+
+- Import time: imports bot.py in a fresh Python process several times
+- Time to ready: logs in for real and waits for on_ready (needs DISCORD_BOT_TOKEN)
+
+Usage: python bench_startup.py [runs]
+"""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RUNS = 5
+READY_TIMEOUT = 60  # seconds to wait for a login before giving up
+
+IMPORT_SNIPPET = """
+from time import perf_counter
+start = perf_counter()
+import bot
+import sys
+print(perf_counter() - start)
+print('loaded=' + ','.join(m for m in ('flask', 'requests') if m in sys.modules))
+"""
+
+def measure_import():
+    """Import bot.py in a fresh interpreter, return (seconds, heavy modules loaded)"""
+    result = subprocess.run(
+        [sys.executable, '-c', IMPORT_SNIPPET],
+        cwd=HERE, capture_output=True, text=True, check=True
+    )
+    lines = result.stdout.splitlines()
+    loaded = next((line[len('loaded='):] for line in lines if line.startswith('loaded=')), '')
+    return float(lines[0]), loaded
+
+def measure_ready():
+    """Run the bot until on_ready and return the time it reported"""
+    env = dict(os.environ, STARTUP_BENCHMARK='1', PYTHONIOENCODING='utf-8')
+    try:
+        result = subprocess.run(
+            [sys.executable, 'bot.py'],
+            cwd=HERE, env=env, capture_output=True, text=True, timeout=READY_TIMEOUT
+        )
+    except subprocess.TimeoutExpired as e:
+        stdout = e.stdout.decode(errors='replace') if isinstance(e.stdout, bytes) else (e.stdout or '')
+        stderr = e.stderr.decode(errors='replace') if isinstance(e.stderr, bytes) else (e.stderr or '')
+        raise RuntimeError(f"bot never reported ready (timed out after {READY_TIMEOUT}s):\n{stdout}{stderr}")
+    if result.returncode != 0:
+        raise RuntimeError(f"bot exited with code {result.returncode}:\n{result.stdout}{result.stderr}")
+    match = re.search(r'Time to ready: ([\d.]+)s', result.stdout)
+    if not match:
+        raise RuntimeError(f"bot never reported ready:\n{result.stdout}{result.stderr}")
+    return float(match.group(1))
+
+def report(name, samples):
+    print(f"{name}: median {statistics.median(samples):.3f}s, "
+          f"min {min(samples):.3f}s, max {max(samples):.3f}s ({len(samples)} runs)")
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS
+    
+    import_samples = []
+    for _ in range(runs):
+        seconds, loaded = measure_import()
+        import_samples.append(seconds)
+    report("Import time", import_samples)
+    if loaded:
+        print(f"  ⚠️ loaded at import time (should be lazy): {loaded}")
+    
+    token = os.getenv('DISCORD_BOT_TOKEN')
+    if not token or token == 'YOUR_BOT_TOKEN_HERE':
+        print("Time to ready: skipped (set DISCORD_BOT_TOKEN to measure)")
+        sys.exit(0)
+    
+    ready_samples = []
+    for _ in range(runs):
+        try:
+            ready_samples.append(measure_ready())
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            break
+    if ready_samples:
+        report("Time to ready", ready_samples)
+    if len(ready_samples) < runs:
+        sys.exit(1)
@@ -10,16 +10,20 @@ FEATURES:
 - Auto-populates Google Sheet via Apps Script
 """
 
-import discord
-from discord.ext import commands, tasks
-import requests
-import json
+from time import perf_counter
+
+# Taken before anything heavy is imported so "time to ready" covers the whole cold start
+STARTUP_STARTED = perf_counter()
+
 from datetime import datetime, time
 import asyncio
 import os
 import random
 from threading import Thread
-from flask import Flask, request, jsonify
+
+import discord
+from discord.ext import commands, tasks
+# requests and flask are imported lazily where they're used so they don't slow down login
 
 # ========== CONFIGURATION ==========
 DISCORD_BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN', 'YOUR_BOT_TOKEN_HERE')
@@ -45,42 +49,51 @@ SUMMARY_SCHEDULE = [
     (2, 21),  # Wednesday at 9 PM (21:00)
 ]
 
+# Set to "1" to log in, print the time to ready and exit (used by bench_startup.py)
+STARTUP_BENCHMARK = os.getenv('STARTUP_BENCHMARK') == '1'
+
 # ========== FLASK WEB SERVER ==========
-app = Flask(__name__)
+def create_app():
+    """Build the Flask app (flask is only imported once the bot is online)"""
+    from flask import Flask, request, jsonify
 
-@app.route('/notify', methods=['POST'])
-def handle_rejection_notification():
-    """Handle batched status update notifications from Google Sheets"""
-    try:
-        data = request.get_json()
-        
-        # Verify secret
-        if data.get('secret') != REJECTION_SECRET:
-            return jsonify({"success": False, "error": "Invalid secret"}), 401
-        
-        discord_user = data.get('discord_user')  # e.g., "username#1234"
-        approved_items = data.get('approved', [])  # List of approved items
-        rejected_items = data.get('rejected', [])  # List of {item, reason} objects
-        
-        # Send the batched notification via Discord bot
-        asyncio.run_coroutine_threadsafe(
-            send_batched_update_dm(discord_user, approved_items, rejected_items),
-            bot.loop
-        )
-        
-        return jsonify({"success": True})
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    app = Flask(__name__)
+
+    @app.route('/notify', methods=['POST'])
+    def handle_rejection_notification():
+        """Handle batched status update notifications from Google Sheets"""
+        try:
+            data = request.get_json()
+            
+            # Verify secret
+            if data.get('secret') != REJECTION_SECRET:
+                return jsonify({"success": False, "error": "Invalid secret"}), 401
+            
+            discord_user = data.get('discord_user')  # e.g., "username#1234"
+            approved_items = data.get('approved', [])  # List of approved items
+            rejected_items = data.get('rejected', [])  # List of {item, reason} objects
+            
+            # Send the batched notification via Discord bot
+            asyncio.run_coroutine_threadsafe(
+                send_batched_update_dm(discord_user, approved_items, rejected_items),
+                bot.loop
+            )
+            
+            return jsonify({"success": True})
+            
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
 
-@app.route('/health', methods=['GET'])
-def health_check():
-    """Health check endpoint"""
-    return jsonify({"status": "online", "bot": "Food Request Bot"})
+    @app.route('/health', methods=['GET'])
+    def health_check():
+        """Health check endpoint"""
+        return jsonify({"status": "online", "bot": "Food Request Bot"})
+
+    return app
 
 def run_flask():
     """Run Flask in a separate thread"""
-    app.run(host='0.0.0.0', port=8080)
+    create_app().run(host='0.0.0.0', port=8080)
 
 async def send_batched_update_dm(discord_handle, approved_items, rejected_items):
     """Send batched status update DM to user"""
@@ -154,8 +167,40 @@ bot = commands.Bot(command_prefix='!', intents=intents)
 # Track pending confirmations (user_id -> {items, duplicates, timestamp})
 pending_confirmations = {}
 
+# Flipped on the first on_ready so reconnects don't redo startup
+startup_complete = False
+
+def warm_imports():
+    """Import requests off the event loop so the first DM doesn't pay for it"""
+    import requests
+
+def ensure_schedule_running():
+    """(Re)start the schedule loop if it isn't running (e.g. it died on an error)"""
+    if not send_request_prompts.is_running():
+        send_request_prompts.start()
+
+def start_background_services():
+    """Start the Flask server and the schedule loop (once the bot has logged in)"""
+    flask_thread = Thread(target=run_flask, daemon=True)
+    flask_thread.start()
+    print("Flask server started on port 8080")
+    
+    Thread(target=warm_imports, daemon=True).start()
+    
+    ensure_schedule_running()
+
 @bot.event
 async def on_ready():
+    global startup_complete
+    
+    # on_ready fires again after every reconnect - Flask is already running,
+    # only bring the schedule loop back if it stopped
+    if startup_complete:
+        print(f'🔄 Reconnected as {bot.user}, skipping startup')
+        ensure_schedule_running()
+        return
+    startup_complete = True
+    
     print('='*50)
     print('🤖 Food Request Bot v2.0 online')
     print(f'Bot: {bot.user}')
@@ -165,8 +210,15 @@ async def on_ready():
     print(f'Scheduled DMs: Sundays & Wednesdays at {REQUEST_TIME}')
     print('Current vibe: cautiously optimistic')
     print('Powered by: caffeine and spite')
+    print(f'Time to ready: {perf_counter() - STARTUP_STARTED:.2f}s')
     print('='*50)
-    send_request_prompts.start()
+    
+    # Benchmark runs only measure startup - don't start the server or send any DMs
+    if STARTUP_BENCHMARK:
+        await bot.close()
+        return
+    
+    start_background_services()
 
 @bot.event
 async def on_member_join(member):
@@ -402,6 +454,9 @@ async def process_food_request(message):
 
 async def add_items_to_sheet(message, items, force=False):
     """Add items to Google Sheet, with optional force flag to bypass duplicate check"""
+    # Already imported by warm_imports() after startup, so this is just a lookup
+    import requests
+
     try:
         discord_handle = f"{message.author.name}#{message.author.discriminator}"
         
@@ -656,12 +711,5 @@ if __name__ == "__main__":
     print("2. APPS_SCRIPT_URL")
     print("3. API_SECRET")
     
-    # Start Flask server in background thread
-    flask_thread = Thread(target=run_flask, daemon=True)
-    flask_thread.start()
-    print("Flask server started on port 8080")
-    
-    # Start Discord bot
-    bot.run(DISCORD_BOT_TOKEN)
-    # Start Discord bot
+    # Start Discord bot - Flask and the schedule loop start from on_ready after login
     bot.run(DISCORD_BOT_TOKEN)